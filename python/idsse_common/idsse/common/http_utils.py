@@ -74,8 +74,7 @@ class HttpUtils(ProtocolUtils):
                 # Check if the request was successful
                 if response.status_code == 200:
                     # Check that we have a directory to write to...
-                    if not os.path.exists(os.path.dirname(dest)):
-                        os.makedirs(os.path.dirname(dest))
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
                     # Open a file in binary write mode
                     with open(dest, "wb") as file:
                         shutil.copyfileobj(response.raw, file)
@@ -22,7 +22,7 @@ from pyproj import CRS, Transformer
 from pyproj.enums import TransformDirection
 
 from idsse.common.utils import round_values, RoundingParam
-from idsse.common.sci.utils import coordinate_pairs_to_axes
+from idsse.common.sci.utils import round_values_array
 
 # type hints
 Scalar = int | float | np.integer | np.float_
@@ -218,15 +218,15 @@ class GridProj:
             # single x, y Pixel (base case)
             return x * self._dx + self._x_offset, y * self._dy + self._y_offset
 
+        if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
+            # numpy arrays can be mapped in one shot, rather than pixel by pixel
+            return x * self._dx + self._x_offset, y * self._dy + self._y_offset
+
         if isinstance(x, Iterable) and isinstance(y, Iterable):
             # Merge x array/tuple/list and y array/tuple/list into list of x/y pairs, transform
             # each pixel pair to a CRS pair, then split list again into array of x coordinates
             # and y coordinates (now in CRS dimensions) and return
             crs_pairs = [self.map_pixel_to_crs(*pixel_coords) for pixel_coords in zip(x, y)]
-
-            # if passed as numpy arrays, return numpy arrays. Otherwise return as lists
-            if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
-                return coordinate_pairs_to_axes(crs_pairs)
             return tuple(zip(*crs_pairs))
 
         raise TypeError(
@@ -283,16 +283,22 @@ class GridProj:
                 return tuple(round_values(i, j, rounding=rounding, precision=precision))
             return i, j
 
+        if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
+            # numpy arrays can be mapped in one shot, rather than coordinate by coordinate
+            i = (x - self._x_offset) / self._dx
+            j = (y - self._y_offset) / self._dy
+
+            if rounding is not None:
+                return (round_values_array(i, rounding, precision),
+                        round_values_array(j, rounding, precision))
+            return i, j
+
         if isinstance(x, Iterable) and isinstance(y, Iterable):
             # Merge array of x coordinates with array of y coordinates to make list of CRS
             # x, y pairs. Transform each CRS pair to a pixel (recursively), then split back into
             # arrays of x coordinates and y coordinates (but now dimensions are pixel, not CRS)
             pixel_pairs = [self.map_crs_to_pixel(*crs_coord, rounding, precision)
                            for crs_coord in zip(x, y)]
-
-            # if passed as numpy arrays, return numpy arrays. Otherwise return as lists
-            if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
-                return coordinate_pairs_to_axes(pixel_pairs)
             return tuple(zip(*pixel_pairs))
 
         # x value(s) and y value(s) were not the same shape
@@ -17,6 +17,8 @@ from typing import NewType
 import numpy
 # import shapely
 
+from idsse.common.utils import RoundingMethod, RoundingParam, to_rounding_method
+
 logger = logging.getLogger(__name__)
 
 # type aliases
@@ -40,3 +42,53 @@ def coordinate_pairs_to_axes(
             as all coordinates on x axis, followed by all coordinates on y axis
     """
     return tuple(numpy.array(dim_coord, dtype=dtype) for dim_coord in tuple(zip(*points)))
+
+
+def round_half_away_array(values: numpy.ndarray | Sequence[float],
+                          precision: int = 0) -> numpy.ndarray:
+    """Round an array of numbers to a set number of decimal places, using "ties away from zero"
+    method. This is the vectorized equivalent of idsse.common.utils.round_half_away(), in
+    contrast with numpy.round() which uses "ties to even".
+
+    Args:
+        values (numpy.ndarray | Sequence[float]): numbers to be rounded
+        precision (int): number of decimal places to preserve. Defaults to 0.
+
+    Returns:
+        numpy.ndarray: rounded numbers as ints if precision is 0, otherwise as floats
+    """
+    factor = 10 ** precision
+    factored = numpy.asarray(values, dtype=numpy.float64) * factor
+    truncated = numpy.trunc(factored)
+    rounded = numpy.where(numpy.abs(factored - truncated) < 0.5,
+                          truncated,
+                          truncated + numpy.sign(factored)) / factor
+    return rounded.astype(numpy.int64) if precision == 0 else rounded
+
+
+def round_values_array(values: numpy.ndarray | Sequence[float],
+                       rounding: RoundingParam | None,
+                       precision: int = 0) -> numpy.ndarray:
+    """Round an array of numbers, the vectorized equivalent of idsse.common.utils.round_values().
+
+    Args:
+        values (numpy.ndarray | Sequence[float]): numbers to be rounded
+        rounding (RoundingParam | None): one of None, 'round', 'floor'. None truncates to int.
+        precision (int): number of decimal places to preserve when rounding is 'round'.
+            Defaults to 0.
+
+    Raises:
+        ValueError: if rounding argument is invalid.
+
+    Returns:
+        numpy.ndarray: rounded numbers as ints, or as floats if rounding with precision above 0
+    """
+    if rounding is None:
+        return numpy.trunc(values).astype(numpy.int64)
+
+    rounding = to_rounding_method(rounding)
+    if rounding is RoundingMethod.ROUND:
+        return round_half_away_array(values, precision)
+    if rounding is RoundingMethod.FLOOR:
+        return numpy.floor(values).astype(numpy.int64)
+    raise ValueError(f'Unsupported rounding method {rounding}')
@@ -18,14 +18,18 @@ from numbers import Number
 import numpy
 from shapely import (Geometry, LinearRing, LineString,
                      MultiPolygon, Point, Polygon,
-                     from_geojson, from_wkt)
+                     from_geojson, from_wkt, transform)
 
 from idsse.common.sci.grid_proj import GridProj
-from idsse.common.sci.utils import Pixel, Coord, Coords, coordinate_pairs_to_axes
-from idsse.common.utils import round_, round_values, RoundingMethod, RoundingParam
+from idsse.common.sci.utils import (Coord, Coords, coordinate_pairs_to_axes,
+                                    round_half_away_array, round_values_array)
+from idsse.common.utils import round_values, RoundingMethod, RoundingParam
 
 logger = logging.getLogger(__name__)
 
+# most edge/scanline pairs intersected at once when filling a polygon
+_SCANLINE_CHUNK_CELLS = 1 << 20
+
 
 def rasterize(
     geometry: str | Geometry,
@@ -47,6 +51,7 @@ def rasterize(
 
     Returns:
         tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
+            Both arrays are empty if the geometry is empty.
     """
     if isinstance(geometry, str):
         geometry = from_wkt(geometry)
@@ -58,14 +63,8 @@ def rasterize(
     if isinstance(geometry, Polygon):
         return rasterize_polygon(geometry, grid_proj, rounding)
     if isinstance(geometry, MultiPolygon):
-        x_coords = numpy.empty(0, dtype=numpy.int32)
-        y_coords = numpy.empty(0, dtype=numpy.int32)
-        for poly in geometry.geoms:
-            poly_coords = rasterize_polygon(poly, grid_proj, rounding)
-            x_coords = numpy.concatenate((x_coords, poly_coords[0]))
-            y_coords = numpy.concatenate((y_coords, poly_coords[1]))
-
-        return x_coords, y_coords
+        return _concatenate_pixels(rasterize_polygon(poly, grid_proj, rounding)
+                                   for poly in geometry.geoms)
 
     raise TypeError(f'Passed geometry is type:{type(geometry)}, which is not supported')
 
@@ -90,11 +89,14 @@ def rasterize_point(
 
     Returns:
         Tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
+            Both arrays are empty if the geometry is empty.
     """
     if isinstance(point, str):
         point = from_wkt(point)
 
     if isinstance(point, Point):
+        if point.is_empty:
+            return _empty_pixels()
         coord = point.coords[0]
     elif _is_coord(point):
         coord = point
@@ -130,39 +132,30 @@ def rasterize_linestring(
 
     Returns:
         tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
+            Both arrays are empty if the geometry is empty.
     """
     if isinstance(linestring, str):
         linestring = from_wkt(linestring)
 
+    if isinstance(linestring, Geometry) and linestring.is_empty:
+        return _empty_pixels()
+
     if isinstance(linestring, Polygon):
-        x_coords, y_coords = rasterize_linestring(linestring.exterior)
-        for interior in linestring.interiors:
-            interior_coords = rasterize_linestring(interior)
-            x_coords = numpy.concatenate((x_coords, interior_coords[0]))
-            y_coords = numpy.concatenate((y_coords, interior_coords[1]))
-        return x_coords, y_coords
+        return _concatenate_pixels(rasterize_linestring(ring)
+                                   for ring in (linestring.exterior, *linestring.interiors))
 
     if isinstance(linestring, MultiPolygon):
-        x_coords = numpy.empty(0, dtype=numpy.int32)
-        y_coords = numpy.empty(0, dtype=numpy.int32)
-        for poly in linestring.geoms:
-            interior_coords = rasterize_linestring(poly)
-            x_coords = numpy.concatenate((x_coords, interior_coords[0]))
-            y_coords = numpy.concatenate((y_coords, interior_coords[1]))
-        return x_coords, y_coords
+        return _concatenate_pixels(rasterize_linestring(poly) for poly in linestring.geoms)
 
-    if isinstance(linestring, LineString):
-        coords = linestring.coords
-    elif _is_coords(linestring):
-        coords = linestring
-    else:
+    if _is_coords(linestring):
+        linestring = LineString(numpy.asarray(linestring, dtype=numpy.float64))
+    elif not isinstance(linestring, LineString):
         raise TypeError(f'Passed geometry is type:{type(linestring)}, but must be LineString')
 
     if grid_proj is not None:
-        linestring = geographic_linestring_to_pixel(coords, grid_proj, rounding)
+        linestring = geographic_linestring_to_pixel(linestring, grid_proj, rounding)
     else:
-        linestring = LineString([round_values(*coord, rounding=rounding)
-                                 for coord in linestring.coords])
+        linestring = transform(linestring, lambda coords: _round_coords(coords, rounding))
 
     return pixels_for_linestring(linestring)
 
@@ -187,6 +180,7 @@ def rasterize_polygon(
 
     Returns:
         Tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
+            Both arrays are empty if the geometry is empty.
     """
     if isinstance(polygon, str):
         polygon = from_wkt(polygon)
@@ -194,20 +188,18 @@ def rasterize_polygon(
     if isinstance(polygon, dict):
         polygon = from_geojson(json.dumps(polygon))
 
-    if isinstance(polygon, Polygon):
-        coords = [list(interior.coords) for interior in polygon.interiors]
-        coords.insert(0, list(coord for coord in polygon.exterior.coords))
-    elif all(_is_coords(coords) for coords in polygon):
-        coords = polygon
-    else:
-        raise TypeError(f'Passed geometry is type:{type(polygon)}, but must be Polygon')
+    if isinstance(polygon, Polygon) and polygon.is_empty:
+        return _empty_pixels()
+
+    if not isinstance(polygon, Polygon):
+        if not all(_is_coords(coords) for coords in polygon):
+            raise TypeError(f'Passed geometry is type:{type(polygon)}, but must be Polygon')
+        polygon = Polygon(polygon[0], holes=polygon[1:])
 
     if grid_proj is not None:
-        polygon = geographic_polygon_to_pixel(coords, grid_proj, rounding)
+        polygon = geographic_polygon_to_pixel(polygon, grid_proj, rounding)
     else:
-        coords = [[round_values(*coord, rounding=rounding)
-                  for coord in ring] for ring in coords]
-        polygon = Polygon(coords[0], holes=coords[1:])
+        polygon = transform(polygon, lambda coords: _round_coords(coords, rounding))
 
     return pixels_in_polygon(polygon)
 
@@ -263,6 +255,8 @@ def geographic_point_to_pixel(
     """
     if not isinstance(point, Point):
         raise ValueError(f'Geometry must be a Point but is a {type(point)}')
+    if point.is_empty:
+        return point
 
     coords = grid_proj.map_geo_to_pixel(*list(zip(*point.coords)), rounding)
     return Point(coords)
@@ -286,15 +280,15 @@ def geographic_linestring_to_pixel(
         LineString: Shapely LineString with vertices defined by x,y pixels
     """
     if _is_coords(linestring):
-        coords = linestring
-    elif isinstance(linestring, LineString):
-        coords = linestring.coords
-    else:
-        raise TypeError(f'Geometry must be a LineString but is a {type(linestring)}')
-
-    coords = list(zip(*grid_proj.map_geo_to_pixel(*list(zip(*coords)), rounding)))
+        coords = numpy.asarray(linestring, dtype=numpy.float64)
+        return LineString(_geo_coords_to_pixel(coords, grid_proj, rounding))
+    if isinstance(linestring, LineString):
+        if linestring.is_empty:
+            return linestring
+        return transform(linestring,
+                         lambda coords: _geo_coords_to_pixel(coords, grid_proj, rounding))
 
-    return LineString(coords)
+    raise TypeError(f'Geometry must be a LineString but is a {type(linestring)}')
 
 
 def geographic_polygon_to_pixel(
@@ -316,17 +310,17 @@ def geographic_polygon_to_pixel(
         Polygon: Shapely Polygon with vertices defined by x,y pixels
     """
     if isinstance(poly, Polygon):
-        exterior = poly.exterior.coords
-        interiors = poly.interiors
-    elif all(_is_coords(coords) for coords in poly):
-        exterior = poly[0]
-        interiors = poly[1:]
-    else:
+        if poly.is_empty:
+            return poly
+        # shapely maps every ring's coordinates in one array, keeping the polygon's structure
+        return transform(poly, lambda coords: _geo_coords_to_pixel(coords, grid_proj, rounding))
+    if not all(_is_coords(coords) for coords in poly):
         raise TypeError(f'Geometry must be a Polygon but is a {type(poly)}')
 
-    exterior = list(zip(*grid_proj.map_geo_to_pixel(*list(zip(*exterior)), rounding)))
-    interiors = [list(zip(*grid_proj.map_geo_to_pixel(*list(zip(*interior.coords)), rounding)))
-                 for interior in interiors]
+    # map exterior and all interiors in a single call, then split back into rings
+    coords = numpy.concatenate([numpy.asarray(ring, dtype=numpy.float64) for ring in poly])
+    pixels = _geo_coords_to_pixel(coords, grid_proj, rounding)
+    exterior, *interiors = numpy.split(pixels, numpy.cumsum([len(ring) for ring in poly[:-1]]))
 
     return Polygon(exterior, holes=interiors)
 
@@ -340,7 +334,8 @@ def pixels_for_linestring(linestring: LineString) -> tuple[numpy.array]:
     Returns:
         Tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
     """
-    return coordinate_pairs_to_axes(_pixels_for_linestring(linestring), dtype=numpy.int64)
+    pixels = _pixels_for_linestring(linestring)
+    return pixels[:, 0], pixels[:, 1]
 
 
 def pixels_in_polygon(poly: Polygon) -> tuple[numpy.ndarray]:
@@ -353,88 +348,115 @@ def pixels_in_polygon(poly: Polygon) -> tuple[numpy.ndarray]:
         Tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
     """
     pixels = _pixels_for_polygon(poly.exterior)
+    if not poly.interiors:
+        return pixels[:, 0], pixels[:, 1]
+
+    # mark the exterior's pixels on a bitmap of its bounding box (indexed x,y), then clear
+    # the pixels inside each hole, leaving the hole's edge as part of the polygon
+    origin = pixels.min(axis=0)
+    shape = tuple(pixels.max(axis=0) - origin + 1)
+    grid = numpy.zeros(shape, dtype=bool)
+    grid[tuple((pixels - origin).T)] = True
     for inner in poly.interiors:
-        pixels_on_inner_edge = _pixels_for_linestring(inner)
-        for pixel in _pixels_for_polygon(inner):
-            if pixel not in pixels_on_inner_edge:
-                pixels.remove(pixel)
+        _clear_hole(grid, origin, inner)
 
-    return coordinate_pairs_to_axes(pixels, dtype=numpy.int64)
+    # nonzero walks the bitmap in x then y order, same as the sorted pixels
+    x_pixels, y_pixels = numpy.nonzero(grid)
+    return x_pixels + origin[0], y_pixels + origin[1]
 
 
+def _clear_hole(grid: numpy.ndarray, origin: numpy.ndarray, hole_boundary: LinearRing):
+    """Clear the pixels inside a polygon's hole, but not on its edge, from the polygon's bitmap
+
+    Args:
+        grid (numpy.ndarray): Bitmap (indexed x,y) of the polygon's pixels, updated in place
+        origin (numpy.ndarray): The x,y pixel of the bitmap's first cell
+        hole_boundary (LinearRing): The hole's ring, with vertices defined by x,y pixels
+    """
+    # mark the hole on a bitmap of only its own bounding box
+    hole_pixels = _pixels_for_polygon(hole_boundary)
+    hole_origin = hole_pixels.min(axis=0)
+    hole = numpy.zeros(tuple(hole_pixels.max(axis=0) - hole_origin + 1), dtype=bool)
+    hole[tuple((hole_pixels - hole_origin).T)] = True
+    hole[tuple((_pixels_for_linestring(hole_boundary) - hole_origin).T)] = False
+
+    # clear where the two bitmaps overlap
+    low = numpy.maximum(hole_origin, origin)
+    high = numpy.minimum(hole_origin + hole.shape, origin + grid.shape)
+    if numpy.any(low >= high):
+        return
+    grid_window = tuple(slice(start, stop) for start, stop in zip(low - origin, high - origin))
+    hole_window = tuple(slice(start, stop)
+                        for start, stop in zip(low - hole_origin, high - hole_origin))
+    grid[grid_window] &= ~hole[hole_window]
+
+
+# pylint: disable=invalid-name
 def _pixels_for_linestring(
         linestring: LineString
-) -> list[Pixel]:
-    """Get pixels crossed while traversing a linestring
+) -> numpy.ndarray:
+    """Get pixels crossed while traversing a linestring. Every segment is walked one pixel at a
+    time along its major axis, with the minor axis rounded, and all segments are processed
+    together in a single vectorized pass.
 
     Args:
-        linestring (LineString): A linestring made of one or more line segments
+        linestring (LineString): A linestring made of one or more line segments,
+                                 with integer vertices
+
+    Raises:
+        TypeError: If any vertex coordinate is not an integer
 
     Returns:
-        list[Pixel]: List of x,y tuples in pixel space
+        numpy.ndarray: Sorted, unique (N, 2) array of x,y pixels
     """
-    coords = linestring.coords
-    pixels = set(_pixels_for_line_seg(coords[0], coords[1]))
-    for pnt1, pnt2 in zip(coords[1:-1], coords[2:]):
-        pixels.update(_pixels_for_line_seg(pnt1, pnt2, exclude_first=True))
+    coords = numpy.asarray(linestring.coords, dtype=numpy.float64)
+    if not numpy.array_equal(coords, numpy.trunc(coords)):
+        raise TypeError('Line segment end points coordinates must be integers')
+    coords = coords.astype(numpy.int64)
 
-    pixels = list(pixels)
-    pixels.sort()
+    # per segment, step along the major axis and compute the minor axis from the line equation
+    shallow, major_start, major_delta, slope, intercept = _segment_lines(coords)
+    step = numpy.where(major_delta > 0, 1, -1)
 
-    return pixels
+    # every segment after the first starts at the previous one's end point, so skip it
+    counts = numpy.abs(major_delta) + 1
+    major_start[1:] += step[1:]
+    counts[1:] -= 1
 
+    major, seg_idx = _ragged_ranges(major_start, counts, step)
+    minor = round_half_away_array(slope[seg_idx] * major + intercept[seg_idx])
+    pixels = numpy.where(shallow[seg_idx, None],
+                         numpy.column_stack((major, minor)),
+                         numpy.column_stack((minor, major)))
+
+    return _unique_pixels(pixels)
 
-# pylint: disable=invalid-name
-def _pixels_for_line_seg(
-    pnt1: tuple[int, int],
-    pnt2: tuple[int, int],
-    exclude_first: bool = False
-) -> list[Pixel]:
-    """Get pixels crossed while traversing a line segment
+
+def _segment_lines(coords: numpy.ndarray) -> tuple[numpy.ndarray]:
+    """Describe each segment of a linestring by the line equation minor = slope * major +
+    intercept, where major is the axis (x or y) along which the segment travels furthest
 
     Args:
-        pnt1 (Pixel): One of the line segment end points in x,y
-        pnt2 (Pixel): The other line segment end point in x,y
-        exclude_first (bool): If true, pnt1 is not included in returned list
+        coords (numpy.ndarray): (N, 2) array of integer x,y vertices
 
     Returns:
-        list[Pixel]: List of x,y tuples in pixel space
+        tuple[numpy.ndarray]: Per segment, whether it is shallow (major axis is x), its start
+            and signed length along the major axis, and the slope and intercept of its line
     """
-    x1, y1 = pnt1
-    x2, y2 = pnt2
-
-    if int(x1) != x1 or int(x2) != x2 or int(y1) != y1 or int(y2) != y2:
-        raise TypeError('Line segment end points coordinates must be integers')
-    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-
-    dx = x2 - x1
-    dy = y2 - y1
-
-    if abs(dy) <= abs(dx):
-        slope = dy / dx if dx != 0 else 0
-        intercept = y1 - slope * x1
-        step = 1 if x1 < x2 else -1
-        if exclude_first:
-            x1 += step
-        pixels = set((x, round_(slope * x + intercept)) for x in range(x1, x2+step, step))
-    else:
-        slope = dx / dy
-        intercept = x1 - slope * y1
-        step = 1 if y1 < y2 else -1
-        if exclude_first:
-            y1 += step
-        pixels = set((round_(slope * y + intercept), y) for y in range(y1, y2+step, step))
+    delta = numpy.diff(coords, axis=0)
+    shallow = numpy.abs(delta[:, 1]) <= numpy.abs(delta[:, 0])
+    axes = numpy.where(shallow[:, None], [0, 1], [1, 0])  # (major, minor) column per segment
+    major_start, minor_start = numpy.take_along_axis(coords[:-1], axes, axis=1).T
+    major_delta, minor_delta = numpy.take_along_axis(delta, axes, axis=1).T
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        slope = minor_delta / major_delta
+    slope[major_delta == 0] = 0  # segment is a single point
+    return shallow, major_start, major_delta, slope, minor_start - slope * major_start
 
-    pixels = list(pixels)
-    pixels.sort()
 
-    return pixels
-
-
-# pylint: disable=too-many-locals
 def _pixels_for_polygon(
     polygon_boundary: LinearRing
-) -> list[Pixel]:
+) -> numpy.ndarray:
     """Get all pixels in a polygon using a line scan algorithm
 
     Args:
@@ -442,41 +464,160 @@ def _pixels_for_polygon(
                                        repeat first vertex as last, likely generated by
                                        call the polygon.boundary property
     Returns:
-        list[Pixel]: List of x,y tuples in pixel space
+        numpy.ndarray: Sorted, unique (N, 2) array of x,y pixels
     """
     xmin, ymin, _, ymax = polygon_boundary.bounds
     x_offset = 0 if xmin >= 0 else int(1-xmin)
-    ymin = floor(ymin)
-    ymax = floor(ymax)
-    edge_info = []
-    for (x1, y1), (x2, y2) in zip(polygon_boundary.coords[:-1], polygon_boundary.coords[1:]):
-        int_y1, int_y2 = int(y1), int(y2)
-        if int_y1 != int_y2:  # only need to include if y values differ
-            if int_y1 > int_y2:  # need to swap order so y1 < y2
-                x1, x2 = x2, x1
-                y1, y2 = y2, y1
-                int_y1, int_y2 = int_y2, int_y1
-
-            edge_info.append((int_y1, int_y2, x1+x_offset, (x2 - x1)/(y2 - y1)))
-
-    pixels = set()
-    for y in range(ymin, ymax+1):
-        x_list = []
-        for y1, y2, x, slope in edge_info:
-            if y1 <= y <= y2:
-                x_list.append(int(x + (y-y1) * slope))
-
-        x_list.sort()
-
-        for x1, x2 in zip(x_list[:-1], x_list[1:]):
-            pixels.update([(x, y) for x in range(x1-x_offset, x2-x_offset+1)])
 
     # make sure the edges are included in list of pixels
-    pixels.update(_pixels_for_linestring(polygon_boundary))
-    pixels = list(pixels)
-    pixels.sort()
+    edge_pixels = _pixels_for_linestring(polygon_boundary)
+    edges = _scanline_edges(polygon_boundary, x_offset)
+    if edges is None:  # flat ring, no scanline crosses it
+        return edge_pixels
+
+    # intersect the scanlines with the edges a bounded chunk at a time, so that memory
+    # grows with the number of edges plus pixels rather than edges times scanlines
+    scanlines = numpy.arange(floor(ymin), floor(ymax) + 1, dtype=numpy.int64)
+    chunk_size = max(1, _SCANLINE_CHUNK_CELLS // len(edges[0]))
+    row_pixels = [_scanline_pixels(scanlines[chunk_start:chunk_start + chunk_size], edges, x_offset)
+                  for chunk_start in range(0, len(scanlines), chunk_size)]
+
+    return _unique_pixels(numpy.concatenate(row_pixels + [edge_pixels]))
+
+
+def _scanline_edges(
+    polygon_boundary: LinearRing,
+    x_offset: int
+) -> tuple[numpy.ndarray] | None:
+    """Get the polygon's edges that scanlines can cross, as structure-of-arrays
+
+    Args:
+        polygon_boundary (LinearRing): The outside of a polygon
+        x_offset (int): Shift applied to the x values, so that they are all positive
+
+    Returns:
+        tuple[numpy.ndarray] | None: Starting x, integer starting and ending y, and dx/dy of
+            each edge, oriented so that the starting y is the smaller. None if no edge spans
+            more than one scanline.
+    """
+    coords = numpy.asarray(polygon_boundary.coords, dtype=numpy.float64)
+    x1s, y1s = coords[:-1, 0], coords[:-1, 1]
+    x2s, y2s = coords[1:, 0], coords[1:, 1]
+    int_y1s, int_y2s = y1s.astype(numpy.int64), y2s.astype(numpy.int64)
+    keep = int_y1s != int_y2s  # only need to include if y values differ
+    if not keep.any():
+        return None
+
+    swap = int_y1s > int_y2s
+    x1s, x2s = numpy.where(swap, x2s, x1s)[keep], numpy.where(swap, x1s, x2s)[keep]
+    y1s, y2s = numpy.where(swap, y2s, y1s)[keep], numpy.where(swap, y1s, y2s)[keep]
+    slopes = (x2s - x1s) / (y2s - y1s)
+
+    return (x1s + x_offset,
+            numpy.where(swap, int_y2s, int_y1s)[keep],
+            numpy.where(swap, int_y1s, int_y2s)[keep],
+            slopes)
+
+
+def _scanline_pixels(
+    scanlines: numpy.ndarray,
+    edges: tuple[numpy.ndarray],
+    x_offset: int
+) -> numpy.ndarray:
+    """Intersect scanlines with polygon edges, and get the pixels of each scanline that fall
+    within the polygon. Filling between each consecutive pair of sorted crossings covers the
+    first to the last crossing.
+
+    Args:
+        scanlines (numpy.ndarray): Integer y values of the scanlines
+        edges (tuple[numpy.ndarray]): Polygon edges, as returned by _scanline_edges()
+        x_offset (int): Shift that was applied to the edges' x values
+
+    Returns:
+        numpy.ndarray: (N, 2) array of x,y pixels
+    """
+    x1s, int_y1s, int_y2s, slopes = edges
+    # shape (n_edges, n_scanlines)
+    crosses = (int_y1s[:, None] <= scanlines) & (scanlines <= int_y2s[:, None])
+    x_crossings = (x1s[:, None] + (scanlines - int_y1s[:, None]) * slopes[:, None]
+                   ).astype(numpy.int64)
+
+    filled = crosses.sum(axis=0) >= 2
+    row_start = numpy.where(crosses, x_crossings, numpy.iinfo(numpy.int64).max).min(axis=0)[filled]
+    row_end = numpy.where(crosses, x_crossings, numpy.iinfo(numpy.int64).min).max(axis=0)[filled]
+
+    x_pixels, row_idx = _ragged_ranges(row_start - x_offset, row_end - row_start + 1)
+    return numpy.column_stack((x_pixels, scanlines[filled][row_idx]))
+
+
+def _ragged_ranges(
+    starts: numpy.ndarray,
+    counts: numpy.ndarray,
+    steps: numpy.ndarray | int = 1
+) -> tuple[numpy.ndarray]:
+    """Build several integer ranges at once, the i-th holding counts[i] values beginning at
+    starts[i] and advancing by steps[i], all concatenated into one array
+
+    Returns:
+        tuple[numpy.ndarray]: The concatenated ranges, and the index of the range each
+            value belongs to
+    """
+    range_idx = numpy.repeat(numpy.arange(len(counts)), counts)
+    range_firsts = numpy.cumsum(counts) - counts
+    if not numpy.isscalar(steps):
+        steps = steps[range_idx]
+    values = (starts[range_idx]
+              + (numpy.arange(counts.sum(), dtype=numpy.int64) - range_firsts[range_idx]) * steps)
+    return values, range_idx
+
+
+def _concatenate_pixels(pixel_axes: Iterable[tuple[numpy.ndarray]]) -> tuple[numpy.ndarray]:
+    """Join the (x, y) pixel arrays of several geometries, copying each axis only once
+
+    Args:
+        pixel_axes (Iterable[tuple[numpy.ndarray]]): x and y pixel arrays for each geometry
+
+    Returns:
+        tuple[numpy.array]: First array represent the x-coordinate and the seconde the y.
+    """
+    pixel_axes = list(pixel_axes)
+    if not pixel_axes:
+        return _empty_pixels()
+
+    x_coords, y_coords = zip(*pixel_axes)
+    return numpy.concatenate(x_coords), numpy.concatenate(y_coords)
+
+
+def _unique_pixels(pixels: numpy.ndarray) -> numpy.ndarray:
+    """Sort an (N, 2) array of x,y pixels by x then y, and drop duplicates. Each pixel is packed
+    into a single int64 key, which numpy.unique sorts far faster than rows (numpy.unique axis=0).
+    """
+    if len(pixels) == 0:
+        return pixels
+    origin = pixels.min(axis=0)
+    height = pixels[:, 1].max() - origin[1] + 1
+    keys = numpy.unique((pixels[:, 0] - origin[0]) * height + (pixels[:, 1] - origin[1]))
+    return numpy.column_stack((keys // height + origin[0], keys % height + origin[1]))
+
+
+def _empty_pixels() -> tuple[numpy.ndarray]:
+    """Pixels for an empty geometry: zero-length x and y arrays"""
+    return numpy.empty(0, dtype=numpy.int64), numpy.empty(0, dtype=numpy.int64)
+
+
+def _geo_coords_to_pixel(
+    coords: numpy.ndarray,
+    grid_proj: GridProj,
+    rounding: RoundingParam | None = None
+) -> numpy.ndarray:
+    """Map an (N, 2) array of lon,lat coordinates to an (N, 2) float array of x,y pixels"""
+    pixel_xs, pixel_ys = grid_proj.map_geo_to_pixel(coords[:, 0], coords[:, 1], rounding)
+    return numpy.column_stack((pixel_xs, pixel_ys)).astype(numpy.float64, copy=False)
+
 
-    return pixels
+def _round_coords(coords: numpy.ndarray, rounding: RoundingParam | None) -> numpy.ndarray:
+    """Round an (N, 2) array of coordinates to whole numbers, kept as floats for shapely"""
+    return round_values_array(coords, rounding).astype(numpy.float64)
 
 
 def _is_coord(arg) -> bool:
@@ -30,6 +30,10 @@ class RoundingMethod(Enum):
 
 RoundingParam = str | RoundingMethod
 
+# character positions of the hyphens in a canonical 36 character UUID string
+_UUID_HYPHEN_INDICES = (8, 13, 18, 23)
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
 
 class TimeDelta(timedelta):
     """Extend class for datetime.timedelta to add helpful properties."""
@@ -128,10 +132,10 @@ def exec_cmd(commands: Sequence[str], timeout: int | None = None) -> Sequence[st
 
 def to_iso(date_time: datetime) -> str:
     """Format a datetime instance to an ISO string"""
-    return (f'{date_time.strftime("%Y-%m-%dT%H:%M")}:'
-            f'{(date_time.second + date_time.microsecond / 1e6):06.3f}'
-            'Z' if date_time.tzname() in [None, str(timezone.utc)]
-            else date_time.strftime("%Z")[3:])
+    if date_time.tzname() in [None, str(timezone.utc)]:
+        # isoformat is implemented in C; drop tzinfo so the '+00:00' suffix can be replaced by 'Z'
+        return f'{date_time.replace(tzinfo=None).isoformat(timespec="milliseconds")}Z'
+    return date_time.strftime("%Z")[3:]
 
 
 def to_compact(date_time: datetime) -> str:
@@ -243,6 +247,26 @@ def round_half_away(number: int | float, precision: int = 0) -> int | float:
     return int(rounded_number) if precision == 0 else float(rounded_number)
 
 
+def to_rounding_method(rounding: RoundingParam) -> RoundingMethod:
+    """Cast a rounding parameter to a RoundingMethod, matching str values case insensitively
+
+    Args:
+        rounding (RoundingParam): a RoundingMethod, or the name of one
+
+    Raises:
+        ValueError: if rounding is a str that names no RoundingMethod
+
+    Returns:
+        RoundingMethod: the rounding method. Non-str values are returned unchanged.
+    """
+    if isinstance(rounding, str):
+        try:
+            return RoundingMethod[rounding.upper()]
+        except KeyError as exc:
+            raise ValueError(f'Unsupported rounding method {rounding}') from exc
+    return rounding
+
+
 def round_(
     number: int | float,
     precision: int = 0,
@@ -272,12 +296,7 @@ def round_(
     Returns:
         (int | float): rounded number as int if precision is 0, otherwise as float
     """
-    if isinstance(rounding, str):  # cast str to RoundingMethod enum
-        try:
-            rounding = RoundingMethod[rounding.upper()]
-        except KeyError as exc:
-            raise ValueError(f'Unsupported rounding method {rounding}') from exc
-
+    rounding = to_rounding_method(rounding)
     if rounding is RoundingMethod.ROUND:
         return round_half_away(number, precision)
     if rounding is RoundingMethod.FLOOR:
@@ -302,18 +321,28 @@ def round_values(
     return [round_(v, precision=precision, rounding=rounding) for v in args]
 
 
-def is_valid_uuid(uuid: str, version=4) -> bool:
-    """Checks for a valid UUID
+def is_valid_uuid(uuid: str, version: int | None = None) -> bool:
+    """Checks for a valid UUID. Any form accepted by uuid.UUID() is valid, e.g. with braces,
+    a 'urn:uuid:' prefix or no hyphens, though the canonical 8-4-4-4-12 hex digit form is
+    checked without constructing a UUID.
 
     Args:
         uuid (str): String to be checked
-        version (int) : Expect UUID version
+        version (int | None) : Expect UUID version, checked against the UUID's version digit,
+                               so a valid UUID of any other version returns False.
+                               If None any version is accepted. Defaults to None.
 
     Returns:
         bool: result of check
     """
-    try:
-        UUID(uuid, version=version)
-    except ValueError:
+    if not isinstance(uuid, str):
         return False
-    return True
+    hex_digits = uuid.replace('-', '')
+    if (len(uuid) != 36 or any(uuid[idx] != '-' for idx in _UUID_HYPHEN_INDICES)
+            or len(hex_digits) != 32 or not _HEX_DIGITS.issuperset(hex_digits)):
+        try:
+            hex_digits = UUID(uuid).hex
+        except ValueError:
+            return False
+    # the version number is the 13th hex digit (first of the third group)
+    return version is None or hex_digits[12] == str(version)
@@ -8,7 +8,6 @@
 #     Geary Layne (1)
 #
 # ----------------------------------------------------------------------------------
-import json
 import os
 
 from jsonschema import Draft202012Validator, FormatChecker
@@ -16,10 +15,22 @@ from jsonschema.protocols import Validator
 from referencing import Registry
 from referencing.jsonschema import DRAFT202012
 
+try:
+    # orjson parses bytes directly and is notably faster than the standard library json module
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # these two must (at least should) be the same draft
 _validator = Draft202012Validator
 _draft = DRAFT202012
 
+_SCHEMA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'schema')
+
+# parsed schema json, keyed by filename, and complete validators, keyed by schema name
+_SCHEMA_CACHE: dict[str, dict] = {}
+_VALIDATOR_CACHE: dict[str, Validator] = {}
+
 
 def _get_refs(json_obj: dict | list, result: set | None = None) -> set:
     if result is None:
@@ -38,6 +49,16 @@ def _get_refs(json_obj: dict | list, result: set | None = None) -> set:
     return result
 
 
+def _load_schema(filename: str) -> dict:
+    """Load a schema json file from the schema directory, parsing each file only once"""
+    schema = _SCHEMA_CACHE.get(filename)
+    if schema is None:
+        with open(os.path.join(_SCHEMA_DIR, filename), 'rb') as file:
+            schema = _json_loads(file.read())
+        _SCHEMA_CACHE[filename] = schema
+    return schema
+
+
 def get_validator(schema_name) -> Validator:
     """Get a jsonschema Validator to be used when evaluating json messages against specified schema
 
@@ -46,27 +67,28 @@ def get_validator(schema_name) -> Validator:
                            must exist under idss-engine-common/schema
 
     Returns:
-        Validator: A validator loaded with schema and all dependencies
+        Validator: A validator loaded with schema and all dependencies. Validators are cached
+                   by schema name, so repeated calls return the same (immutable) instance.
     """
-    current_path = os.path.dirname(os.path.realpath(__file__))
-    schema_dir = os.path.join(current_path, 'schema')
-    schema_filename = os.path.join(schema_dir, schema_name+'.json')
-    with open(schema_filename, 'r', encoding='utf8') as file:
-        schema: dict = json.load(file)
+    validator = _VALIDATOR_CACHE.get(schema_name)
+    if validator is not None:
+        return validator
+
+    schema = _load_schema(schema_name+'.json')
 
     dependencies = {}
     refs = _get_refs(schema)
     while len(refs):
         new_refs = set()
         for ref in refs:
-            schema_filename = os.path.join(schema_dir, ref)
-            with open(schema_filename, 'r', encoding='utf8') as file:
-                ref_schema: dict = json.load(file)
+            ref_schema = _load_schema(ref)
             dependencies[ref_schema.get('$id', ref)] = _draft.create_resource(ref_schema)
             new_refs = _get_refs(ref_schema, new_refs)
         refs = {ref for ref in new_refs if ref not in dependencies}
 
     # used default Validator type
-    return _validator(schema=schema,
-                      registry=Registry().with_resources(dependencies.items()),
-                      format_checker=FormatChecker())
+    validator = _validator(schema=schema,
+                           registry=Registry().with_resources(dependencies.items()),
+                           format_checker=FormatChecker())
+    _VALIDATOR_CACHE[schema_name] = validator
+    return validator
@@ -26,6 +26,7 @@ setup(name='idsse',
         'develop': [
           'pytest',
           'pytest-cov',
+          'pytest-xdist',
         ]
       },
       zip_safe=False,
@@ -258,6 +258,19 @@ def test_geo_to_pixel_numpy_array(grid_proj: GridProj):
     np.testing.assert_array_equal(pixel_arrays, expected_arrays)
 
 
+def test_crs_to_pixel_numpy_array_floor(grid_proj: GridProj):
+    x_values, y_values = list(zip(*EXAMPLE_CRS))
+    x_array, y_array = np.array(x_values), np.array(y_values)
+    i_array, j_array = grid_proj.map_crs_to_pixel(x_array, y_array)
+    floor_arrays = grid_proj.map_crs_to_pixel(x_array, y_array, rounding='floor')
+
+    # numpy arrays are mapped in one shot, but must match rounding each pixel on its own
+    expected_arrays = ([round_(i, rounding=RoundingMethod.FLOOR) for i in i_array],
+                       [round_(j, rounding=RoundingMethod.FLOOR) for j in j_array])
+    assert all(arr.dtype == np.int64 for arr in floor_arrays)
+    np.testing.assert_array_equal(floor_arrays, expected_arrays)
+
+
 def test_unbalanced_pixel_or_crs_arrays_fail_to_transform(grid_proj: GridProj):
     with raises(TypeError) as exc:
         bad_pixel = (1.0, [1.0, 2.0, 3.0])
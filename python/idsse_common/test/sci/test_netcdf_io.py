@@ -11,6 +11,7 @@
 # pylint: disable=missing-function-docstring,redefined-outer-name,protected-access,unused-argument
 
 import os
+from pathlib import Path
 
 from pytest import fixture, approx
 from numpy import ndarray
@@ -70,11 +71,10 @@ def test_read_netcdf(example_netcdf_data: tuple[dict[str, any], ndarray]):
     assert attrs == EXAMPLE_ATTRIBUTES
 
 
-def test_read_and_write_netcdf(example_netcdf_data: tuple[dict[str, any], ndarray]):
-    # cleanup existing test file if needed
-    temp_netcdf_filepath = './tmp/test_netcdf_file.nc'
-    if os.path.exists(temp_netcdf_filepath):
-        os.remove(temp_netcdf_filepath)
+def test_read_and_write_netcdf(example_netcdf_data: tuple[dict[str, any], ndarray],
+                               tmp_path: Path):
+    # pytest creates (and later cleans up) a unique tmp_path directory for each test
+    temp_netcdf_filepath = str(tmp_path / 'test_netcdf_file.nc')
 
     attrs, grid = example_netcdf_data
 
@@ -89,15 +89,10 @@ def test_read_and_write_netcdf(example_netcdf_data: tuple[dict[str, any], ndarra
     assert new_file_attrs == attrs
     assert new_file_grid[123][321] == grid[123][321]
 
-    # cleanup created netcdf file
-    os.remove(temp_netcdf_filepath)
 
-
-def test_read_and_write_netcdf_with_h5nc(example_netcdf_data: tuple[dict[str, any], ndarray]):
-    # create h5nc file
-    temp_netcdf_h5_filepath = './tmp/test_netcdf_h5_file.nc'
-    if os.path.exists(temp_netcdf_h5_filepath):
-        os.remove(temp_netcdf_h5_filepath)
+def test_read_and_write_netcdf_with_h5nc(example_netcdf_data: tuple[dict[str, any], ndarray],
+                                         tmp_path: Path):
+    temp_netcdf_h5_filepath = str(tmp_path / 'test_netcdf_h5_file.nc')
 
     attrs, grid = example_netcdf_data
 
@@ -110,6 +105,3 @@ def test_read_and_write_netcdf_with_h5nc(example_netcdf_data: tuple[dict[str, an
     # Don't verify h5 attrs for now; they are some custom h5py type and aren't easy to access
     _, new_file_grid = read_netcdf(written_filepath, use_h5_lib=True)
     assert new_file_grid[123][321] == grid[123][321]
-
-    # cleanup created netcdf h5 file
-    os.remove(temp_netcdf_h5_filepath)
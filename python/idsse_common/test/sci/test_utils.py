@@ -0,0 +1,52 @@
+"""Test suite for sci/utils.py"""
+# ----------------------------------------------------------------------------------
+# Created on Sat Oct 17 2026
+#
+# Copyright (c) 2026 Regents of the University of Colorado. All rights reserved. (1)
+#
+# Contributors:
+#     IDSS Engine team (1)
+#
+# ----------------------------------------------------------------------------------
+# pylint: disable=missing-function-docstring
+
+from math import pi
+
+import numpy
+import pytest
+
+from idsse.common.sci.utils import (coordinate_pairs_to_axes, round_half_away_array,
+                                    round_values_array)
+from idsse.common.utils import round_half_away, round_values
+
+
+def test_coordinate_pairs_to_axes():
+    result = coordinate_pairs_to_axes([(1, 2), (3, 4), (5, 6)], dtype=numpy.int64)
+    numpy.testing.assert_array_equal(result, (numpy.array([1, 3, 5]), numpy.array([2, 4, 6])))
+
+
+@pytest.mark.parametrize('precision, numbers, expected', [
+    (0, [2.50000, -14.5000, 3.49999], [3, -15, 3]),
+    (1, [9.5432, -0.8765], [9.5, -0.9]),
+    (3, [100.987654321, -43.21098, pi], [100.988, -43.211, 3.142])
+])
+def test_round_half_away_array(precision: int, numbers: list[float], expected: list[float]):
+    result = round_half_away_array(numpy.array(numbers), precision)
+    assert result.dtype == (numpy.int64 if precision == 0 else numpy.float64)
+    numpy.testing.assert_array_equal(result, numpy.array(expected))
+
+    # batch rounding must agree with the scalar implementation
+    numpy.testing.assert_array_equal(result, [round_half_away(num, precision) for num in numbers])
+
+
+@pytest.mark.parametrize('rounding', [None, 'round', 'floor', 'FLOOR'])
+def test_round_values_array(rounding: str | None):
+    numbers = [2.5, -14.5, 3.49999, -0.2, 7.0]
+    result = round_values_array(numpy.array(numbers), rounding)
+    assert result.dtype == numpy.int64
+    numpy.testing.assert_array_equal(result, round_values(*numbers, rounding=rounding))
+
+
+def test_round_values_array_fails_on_unknown_rounding():
+    with pytest.raises(ValueError):
+        round_values_array(numpy.array([1.5]), 'ceil')
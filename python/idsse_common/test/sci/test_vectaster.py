@@ -14,7 +14,8 @@
 from unittest.mock import Mock
 
 import numpy
-from pytest import fixture, MonkeyPatch
+from pytest import fixture, mark, MonkeyPatch
+from shapely import LineString, Point, Polygon
 
 from idsse.common.sci.grid_proj import GridProj
 from idsse.common.sci.vectaster import (geographic_to_pixel,
@@ -32,16 +33,36 @@ EXAMPLE_PROJ_SPEC = '+proj=lcc +lat_0=25.0 +lon_0=-95.0 +lat_1=25.0 +a=6371200'
 EXAMPLE_GRID_SPEC = '+dx=2539.703 +dy=2539.703 +w=2345 +h=1597 +lat_ll=19.229 +lon_ll=-126.2766'
 
 
-@fixture
+# GridProj and shapely geometries are not modified by vectaster, so share them across the module
+@fixture(scope="module")
 def grid_proj() -> GridProj:
     return GridProj.from_proj_grid_spec(EXAMPLE_PROJ_SPEC, EXAMPLE_GRID_SPEC)
 
 
+@fixture(scope="module")
+def geo_point() -> Point:
+    return from_wkt('POINT (-105 40)')
+
+
+@fixture(scope="module")
+def geo_linestring() -> LineString:
+    return from_wkt('LINESTRING (-105 40, -110 40, -110 50)')
+
+
+@fixture(scope="module")
+def geo_polygon() -> Polygon:
+    return from_wkt('POLYGON ((-105 40, -110 40, -110 50, -105 50, -105 40))')
+
+
+@fixture(scope="module")
+def pixel_polygon_with_hole() -> Polygon:
+    return from_wkt('POLYGON ((0 0, 0 5, 5 5, 5 0, 0 0), (1 1, 3 1, 3 4, 1 4, 1 1))')
+
+
 # test
-def test_geographic_point_to_pixel(grid_proj: GridProj):
-    point = from_wkt('POINT (-105 40)')
+def test_geographic_point_to_pixel(grid_proj: GridProj, geo_point: Point):
     pixel_point = from_wkt('POINT (940.5282319922111 781.3426922405841)')
-    result = geographic_point_to_pixel(point, grid_proj)
+    result = geographic_point_to_pixel(geo_point, grid_proj)
 
     assert result == pixel_point
 
@@ -72,10 +93,11 @@ def test_geographic_polygon_to_pixel(grid_proj: GridProj):
     assert result == pixel_poly
 
 
-def test_geographic_to_pixel(monkeypatch: MonkeyPatch, grid_proj: GridProj):
-    point = from_wkt('POINT (-105 40)')
-    line_string = from_wkt('LINESTRING (-105 40, -110 40, -110 50)')
-    polygon = from_wkt('POLYGON ((-105 40, -110 40, -110 50, -105 50, -105 40))')
+def test_geographic_to_pixel(monkeypatch: MonkeyPatch,
+                             grid_proj: GridProj,
+                             geo_point: Point,
+                             geo_linestring: LineString,
+                             geo_polygon: Polygon):
 
     point_mock = Mock()
     line_str_mock = Mock()
@@ -84,14 +106,14 @@ def test_geographic_to_pixel(monkeypatch: MonkeyPatch, grid_proj: GridProj):
     monkeypatch.setattr('idsse.common.sci.vectaster.geographic_linestring_to_pixel', line_str_mock)
     monkeypatch.setattr('idsse.common.sci.vectaster.geographic_polygon_to_pixel', polygon_mock)
 
-    _ = geographic_to_pixel(point, grid_proj)
-    point_mock.assert_called_once_with(point, grid_proj, None)
+    _ = geographic_to_pixel(geo_point, grid_proj)
+    point_mock.assert_called_once_with(geo_point, grid_proj, None)
 
-    _ = geographic_to_pixel(line_string, grid_proj)
-    line_str_mock.assert_called_once_with(line_string, grid_proj, None)
+    _ = geographic_to_pixel(geo_linestring, grid_proj)
+    line_str_mock.assert_called_once_with(geo_linestring, grid_proj, None)
 
-    _ = geographic_to_pixel(polygon, grid_proj)
-    polygon_mock.assert_called_once_with(polygon, grid_proj, None)
+    _ = geographic_to_pixel(geo_polygon, grid_proj)
+    polygon_mock.assert_called_once_with(geo_polygon, grid_proj, None)
 
 
 def test_rasterize_point(grid_proj: GridProj):
@@ -129,13 +151,12 @@ def test_rasterize_linestring(grid_proj: GridProj):
     numpy.testing.assert_array_equal(result, pixels)
 
 
-def test_rasterize_polygon_as_linestring(grid_proj: GridProj):
-    poly = from_wkt('POLYGON ((0 0, 0 5, 5 5, 5 0, 0 0), (1 1, 3 1, 3 4, 1 4, 1 1))')
+def test_rasterize_polygon_as_linestring(grid_proj: GridProj, pixel_polygon_with_hole: Polygon):
     pixels = (numpy.array([0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 5, 5, 5, 5, 1, 1,
                            1, 1, 2, 2, 3, 3, 3, 3]),
               numpy.array([0, 1, 2, 3, 4, 5, 0, 5, 0, 5, 0, 5, 0, 5, 0, 1, 2, 3, 4, 5, 1, 2,
                            3, 4, 1, 4, 1, 2, 3, 4]))
-    result = rasterize_linestring(poly, grid_proj)
+    result = rasterize_linestring(pixel_polygon_with_hole, grid_proj)
     numpy.testing.assert_array_equal(result, pixels)
 
 
@@ -146,6 +167,14 @@ def test_rasterize_linestring_from_coords(grid_proj: GridProj):
     numpy.testing.assert_array_equal(result, pixels)
 
 
+def test_rasterize_linestring_from_coords_without_grid_proj():
+    linestring = [(0.5, 0.5), (2.5, 1.5), (2.5, 3.5)]
+    pixels = (numpy.array([0, 1, 2, 2, 2]), numpy.array([0, 1, 1, 2, 3]))
+    # default round in floor
+    result = rasterize_linestring(linestring)
+    numpy.testing.assert_array_equal(result, pixels)
+
+
 def test_rasterize_polygon(grid_proj: GridProj):
     poly = 'POLYGON ((-105 40, -105.1 40, -105.1 40.1, -105 40.1, -105 40))'
     pixels = (numpy.array([937, 937, 937, 937, 937, 937, 938, 938, 938, 938, 938, 938, 939,
@@ -166,13 +195,12 @@ def test_rasterize_polygon_from_coords(grid_proj: GridProj):
     numpy.testing.assert_array_equal(result, pixels)
 
 
-def test_rasterize_polygon_with_hole():
-    poly = from_wkt('POLYGON ((0 0, 0 5, 5 5, 5 0, 0 0), (1 1, 3 1, 3 4, 1 4, 1 1))')
+def test_rasterize_polygon_with_hole(pixel_polygon_with_hole: Polygon):
     pixels = (numpy.array([0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3,
                            4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5]),
               numpy.array([0, 1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5, 0, 1, 4, 5, 0, 1, 2, 3, 4, 5,
                            0, 1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5]))
-    result = rasterize_polygon(poly)
+    result = rasterize_polygon(pixel_polygon_with_hole)
     numpy.testing.assert_array_equal(result, pixels)
 
 
@@ -190,9 +218,18 @@ def test_rasterize_multi_polygon():
     numpy.testing.assert_array_equal(result, pixels)
 
 
-def test_rasterize(monkeypatch: MonkeyPatch, grid_proj: GridProj):
-    point = from_wkt('POINT (-105 40)')
-    linestring = from_wkt('LINESTRING (-105 40, -110 40, -110 50)')
+@mark.parametrize('wkt', ['POINT EMPTY', 'LINESTRING EMPTY', 'POLYGON EMPTY',
+                         'MULTIPOLYGON EMPTY'])
+def test_rasterize_empty_geometry(grid_proj: GridProj, wkt: str):
+    empty = (numpy.array([], dtype=numpy.int64), numpy.array([], dtype=numpy.int64))
+    numpy.testing.assert_array_equal(rasterize(wkt), empty)
+    numpy.testing.assert_array_equal(rasterize(wkt, grid_proj), empty)
+
+
+def test_rasterize(monkeypatch: MonkeyPatch,
+                   grid_proj: GridProj,
+                   geo_point: Point,
+                   geo_linestring: LineString):
     polygon = 'POLYGON ((-105 40, -110 40, -110 50, -105 50, -105 40))'
 
     point_mock = Mock()
@@ -202,10 +239,10 @@ def test_rasterize(monkeypatch: MonkeyPatch, grid_proj: GridProj):
     monkeypatch.setattr('idsse.common.sci.vectaster.rasterize_linestring', linestring_mock)
     monkeypatch.setattr('idsse.common.sci.vectaster.rasterize_polygon', polygon_mock)
 
-    rasterize(point, grid_proj)
+    rasterize(geo_point, grid_proj)
     point_mock.assert_called_once()
 
-    rasterize(linestring, grid_proj)
+    rasterize(geo_linestring, grid_proj)
     linestring_mock.assert_called_once()
 
     rasterize(polygon, grid_proj)
@@ -13,6 +13,7 @@
 # pylint: disable=invalid-name,unused-argument, duplicate-code, line-too-long
 
 from datetime import datetime, timedelta, UTC
+from pathlib import Path
 
 from pytest import fixture
 from pytest_httpserver import HTTPServer
@@ -106,22 +107,22 @@ def test_ls_without_prepend_path(http_utils: HttpUtils, httpserver: HTTPServer):
     assert len(result) == len(EXAMPLE_FILES)
     assert result[0] == EXAMPLE_FILES[-1]
 
-def test_cp_succeeds(http_utils: HttpUtils, httpserver: HTTPServer):
+def test_cp_succeeds(http_utils: HttpUtils, httpserver: HTTPServer, tmp_path: Path):
     url = '/data/'+EXAMPLE_PROD_DIR+'/temp.grib2.gz'
     httpserver.expect_request(url).respond_with_data(bytes([0,1,2]), status=200,
                                                      content_type="application/octet-stream")
     path = f'{EXAMPLE_URL}{EXAMPLE_PROD_DIR}/temp.grib2.gz'
-    dest = '/tmp/temp.grib2.gz'
+    dest = str(tmp_path / 'temp.grib2.gz')
 
     copy_success = http_utils.cp(path, dest)
     assert copy_success
 
-def test_cp_fails(http_utils: HttpUtils, httpserver: HTTPServer):
+def test_cp_fails(http_utils: HttpUtils, httpserver: HTTPServer, tmp_path: Path):
     url = '/data/'+EXAMPLE_PROD_DIR+'/temp.grib2.gz'
     httpserver.expect_request(url).respond_with_data(bytes([0, 1, 2]), status=404,
                                                      content_type="application/octet-stream")
     path = f'{EXAMPLE_URL}{EXAMPLE_PROD_DIR}/temp.grib2.gz'
-    dest = '/tmp/temp.grib2.gz'
+    dest = str(tmp_path / 'temp.grib2.gz')
     copy_success = http_utils.cp(path, dest)
     assert not copy_success
 
@@ -16,7 +16,6 @@ import contextvars
 import logging
 import logging.config
 import threading
-import time
 from datetime import datetime, UTC
 from uuid import uuid4 as uuid
 
@@ -110,8 +109,8 @@ def test_getting_logs_from_threaded_func(capsys):
     # Create and start the thread
     thread = threading.Thread(target=contextvars.copy_context().run, args=(worker,))
     thread.start()
+    thread.join()
 
-    time.sleep(.1)
     stdout = capsys.readouterr().out
     assert EXAMPLE_LOG_MESSAGE in stdout
 
@@ -10,14 +10,14 @@
 # --------------------------------------------------------------------------------
 # pylint: disable=missing-function-docstring,disable=invalid-name
 
-from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, UTC
 from math import pi
-from os import path
+import sys
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from idsse.common.utils import TimeDelta, Map
+from idsse.common.utils import TimeDelta, Map, RoundingMethod
 from idsse.common.utils import (
     datetime_gen,
     dict_copy_with,
@@ -27,6 +27,7 @@ from idsse.common.utils import (
     round_,
     round_half_away,
     to_compact,
+    to_rounding_method,
     to_iso
 )
 
@@ -71,17 +72,30 @@ def test_map_dict_set_value():
 
 
 def test_exec_cmd():
-    current_dir = path.dirname(__file__)
-    result = exec_cmd(['ls', current_dir])
+    # run the current Python interpreter, which is always available, rather than ls
+    result = exec_cmd([sys.executable, '-c', 'print("__init__.py\\ntest_utils.py")'])
 
-    # verify that at least __init__ and this file were found
-    assert '__init__.py' in result
-    assert __file__.split(path.sep, maxsplit=-1)[-1] in result
+    assert result == ['__init__.py', 'test_utils.py']
+
+
+def test_exec_cmd_error(monkeypatch: pytest.MonkeyPatch):
+    mock_process = Mock(returncode=2)
+    mock_process.communicate.return_value = (b'', b'No such file or directory')
+    monkeypatch.setattr('idsse.common.utils.Popen',
+                        Mock(return_value=MagicMock(__enter__=Mock(return_value=mock_process))))
+
+    with pytest.raises(OSError) as exc:
+        exec_cmd(['ls', 'missing'])
+    assert exc.value.errno == 2
+    assert 'No such file' in exc.value.strerror
 
 
 def test_to_iso():
     dt = datetime(2013, 12, 11, 10, 9, 8)
     assert to_iso(dt) == '2013-12-11T10:09:08.000Z'
+    assert to_iso(dt.replace(tzinfo=UTC)) == '2013-12-11T10:09:08.000Z'
+    # sub-millisecond precision is truncated, so seconds never round up to 60
+    assert to_iso(datetime(2013, 12, 11, 10, 9, 59, 999600)) == '2013-12-11T10:09:59.999Z'
 
 
 def test_to_compact():
@@ -97,7 +111,7 @@ def test_hash_code(string, hash_code_):
 
 def test_dict_copy_with():
     starting_dict = { 'value': 123, 'units': 'mph'}
-    copied_dict = deepcopy(starting_dict)
+    copied_dict = starting_dict.copy()  # values are immutable, a shallow copy is enough
 
     # run copy
     result = dict_copy_with(
@@ -117,51 +131,24 @@ def test_dict_copy_with():
     assert result['metadata'] == {'some': ('other', 'data')}
 
 
-def test_datetime_gen_forward():
-    dt_start = datetime(2021, 1, 2, 3)
-    time_delta = timedelta(hours=1)
-    max_num = 5
-
-    dts_found = list(datetime_gen(dt_start, time_delta, max_num=max_num))
-    assert dts_found == [datetime(2021, 1, 2, 3, 0),
-                         datetime(2021, 1, 2, 4, 0),
-                         datetime(2021, 1, 2, 5, 0),
-                         datetime(2021, 1, 2, 6, 0),
-                         datetime(2021, 1, 2, 7, 0)]
-
-
-def test_datetime_gen_backwards():
-    dt_start = datetime(2021, 1, 2, 3)
-    time_delta = timedelta(days=-1)
-    max_num = 4
-
-    dts_found = list(datetime_gen(dt_start, time_delta, max_num=max_num))
-    assert dts_found == [datetime(2021, 1, 2, 3, 0),
-                         datetime(2021, 1, 1, 3, 0),
-                         datetime(2020, 12, 31, 3, 0),
-                         datetime(2020, 12, 30, 3, 0)]
+DT_START = datetime(2021, 1, 2, 3)
+EXPECTED_FORWARD = tuple(DT_START + timedelta(hours=i) for i in range(5))
+EXPECTED_BACKWARD = tuple(DT_START - timedelta(days=i) for i in range(4))
+EXPECTED_BOUND = (DT_START, datetime(2021, 1, 16, 3), datetime(2021, 1, 30, 3))
 
 
-def test_datetime_gen_bound():
-    dt_start = datetime(2021, 1, 2, 3)
-    time_delta = timedelta(weeks=2)
-    dt_end = datetime(2021, 1, 30, 3)
-
-    dts_found = list(datetime_gen(dt_start, time_delta, dt_end))
-    assert dts_found == [datetime(2021, 1, 2, 3, 0),
-                         datetime(2021, 1, 16, 3, 0),
-                         datetime(2021, 1, 30, 3, 0)]
-
-
-def test_datetime_gen_switch_time_delta_sign():
-    dt_start = datetime(2021, 1, 2, 3)
-    time_delta = timedelta(weeks=-2)
-    dt_end = datetime(2021, 1, 30, 3)
-
-    dts_found = list(dt_ for dt_ in datetime_gen(dt_start, time_delta, dt_end))
-    assert dts_found == [datetime(2021, 1, 2, 3, 0),
-                         datetime(2021, 1, 16, 3, 0),
-                         datetime(2021, 1, 30, 3, 0)]
+@pytest.mark.parametrize('time_delta, dt_end, max_num, expected', [
+    (timedelta(hours=1), None, 5, EXPECTED_FORWARD),  # forward
+    (timedelta(days=-1), None, 4, EXPECTED_BACKWARD),  # backwards
+    (timedelta(weeks=2), datetime(2021, 1, 30, 3), 100, EXPECTED_BOUND),  # bound
+    (timedelta(weeks=-2), datetime(2021, 1, 30, 3), 100, EXPECTED_BOUND),  # switch delta sign
+])
+def test_datetime_gen(time_delta: timedelta,
+                      dt_end: datetime | None,
+                      max_num: int,
+                      expected: tuple[datetime]):
+    dts_found = tuple(datetime_gen(DT_START, time_delta, dt_end, max_num=max_num))
+    assert dts_found == expected
 
 
 @pytest.mark.parametrize('number, expected', [(2.50000, 3), (-14.5000, -15), (3.49999, 3)])
@@ -196,12 +183,32 @@ def test_invalid_rounding_method_raises_error():
     assert 'None' in exc.value.args[0]
 
 
+@pytest.mark.parametrize('rounding, expected', [
+    ('round', RoundingMethod.ROUND),
+    ('FLOOR', RoundingMethod.FLOOR),
+    (RoundingMethod.FLOOR, RoundingMethod.FLOOR),
+])
+def test_to_rounding_method(rounding, expected):
+    assert to_rounding_method(rounding) is expected
+
+
 def test_is_valid_uuid_success():
     assert is_valid_uuid('f848406c-44eb-491f-99df-d0461090425c')
     assert is_valid_uuid('f848406c-44eb-491f-99df-d0461090425c', version=4)
     assert is_valid_uuid('1d10609e-ba56-11ee-af51-fa605d1346b6', version=1)
+    assert is_valid_uuid('1D10609E-BA56-11EE-AF51-FA605D1346B6', version=1)
+    assert is_valid_uuid('1d10609e-ba56-11ee-af51-fa605d1346b6', version=None)
+    assert is_valid_uuid('1d10609e-ba56-11ee-af51-fa605d1346b6')  # any version by default
+    assert is_valid_uuid('{f848406c-44eb-491f-99df-d0461090425c}', version=4)
+    assert is_valid_uuid('urn:uuid:f848406c-44eb-491f-99df-d0461090425c')
+    assert is_valid_uuid('f848406c44eb491f99dfd0461090425c', version=4)
 
 
 def test_is_valid_uuid_failure():
     assert not is_valid_uuid('abc-def-ghi-jlk')  # badly-formed UUID
     assert not is_valid_uuid('1d10609e-ba56-11ee-af51-fa605d1346b6', version=7)  # invalid version
+    # valid UUIDs, but not of the expected version
+    assert not is_valid_uuid('1d10609e-ba56-11ee-af51-fa605d1346b6', version=4)
+    assert not is_valid_uuid('f848406c44eb491f99dfd0461090425c', version=1)
+    assert not is_valid_uuid('f848406c-44eb-491f-99df-d0461090425z')  # non-hex digit
+    assert not is_valid_uuid('f848406c-44eb-491f-99df-d046109042-5')  # too few hex digits
@@ -12,184 +12,127 @@
 # pylint: disable=duplicate-code
 # cspell:ignore geodist
 
-from jsonschema.exceptions import ValidationError
+from copy import deepcopy
+
 from jsonschema.protocols import Validator
-from pytest import fixture, raises
+from pytest import fixture, mark
 
 from idsse.common.validate_schema import get_validator
 
 
-@fixture
+@fixture(scope="session")
+def request_validator() -> Validator:
+    schema_name = 'das_request_schema'
+    return get_validator(schema_name)
+
+
+@fixture(scope="session")
 def info_request_validator() -> Validator:
     schema_name = 'das_info_request_schema'
     return get_validator(schema_name)
 
 
-@fixture
+@fixture(scope="session")
 def data_request_validator() -> Validator:
     schema_name = 'das_data_request_schema'
     return get_validator(schema_name)
 
 
-@fixture
+@fixture(scope="session")
 def data_response_validator() -> Validator:
     schema_name = 'das_data_response_schema'
     return get_validator(schema_name)
 
 
+DAS_DATA_MESSAGE = {
+    'sourceType': 'join',
+    'sourceObj': {
+        'sources': [{
+            'sourceType': 'condition',
+            'sourceObj': {
+                'mapping': {
+                    'endWeight': [0, 1, 0],
+                    'startWeight': [0, 1, 0],
+                    'controlPoints': ['-Infinity', 35, 75, 'Infinity']},
+                'relational': 'LESSTHAN',
+                'source': {
+                    'sourceType': 'units',
+                    'sourceObj': {
+                        'units': 'F',
+                        'source': {
+                            'sourceType': 'data',
+                            'sourceObj': {
+                                'product': 'NBM',
+                                'field': 'TEMP',
+                                'region': 'CONUS',
+                                'valid': '2022-11-12T00:00:00.000Z',
+                                'issue': '2022-11-11T14:00:00.000Z'}}},
+                    'label': 'NBM:TEMP:Fahrenheit'},
+                'thresh': 60},
+            'label': 'NBM:TEMP:Fahrenheit:LT:60.000:35.000:75.000:true'},
+            {
+            'sourceType': 'condition',
+            'sourceObj': {
+                'mapping': {
+                    'endWeight': [0, 1, 0],
+                    'startWeight': [0, 1, 0],
+                    'controlPoints': ['-Infinity', 0, 5, 'Infinity']},
+                'relational': 'GREATERTHAN',
+                'source': {
+                    'sourceType': 'units',
+                    'sourceObj': {
+                        'units': 'MPH',
+                        'source': {
+                            'sourceType': 'data',
+                            'sourceObj': {
+                                'product': 'NBM',
+                                'field': 'WINDSPEED',
+                                'region': 'CONUS',
+                                'valid': '2022-11-12T00:00:00.000Z',
+                                'issue': '2022-11-11T14:00:00.000Z'}}},
+                    'label': 'NBM:WINDSPEED:MilesPerHour'},
+                'thresh': 3},
+            'label': 'NBM:WINDSPEED:MilesPerHour:GT:3.000:0.000:5.000:true'}],
+        'join': 'AND'},
+    'label': ('AND(NBM:TEMP:Fahrenheit:LT:60.000:35.000:75.000:true, '
+              'NBM:WINDSPEED:MilesPerHour:GT:3.000:0.000:5.000:true)')
+}
+
+
 @fixture
 def das_data_message() -> dict:
-    return {
-        'sourceType': 'join',
-        'sourceObj': {
-            'sources': [{
-                'sourceType': 'condition',
-                'sourceObj': {
-                    'mapping': {
-                        'endWeight': [0, 1, 0],
-                        'startWeight': [0, 1, 0],
-                        'controlPoints': ['-Infinity', 35, 75, 'Infinity']},
-                    'relational': 'LESSTHAN',
-                    'source': {
-                        'sourceType': 'units',
-                        'sourceObj': {
-                            'units': 'F',
-                            'source': {
-                                'sourceType': 'data',
-                                'sourceObj': {
-                                    'product': 'NBM',
-                                    'field': 'TEMP',
-                                    'region': 'CONUS',
-                                    'valid': '2022-11-12T00:00:00.000Z',
-                                    'issue': '2022-11-11T14:00:00.000Z'}}},
-                        'label': 'NBM:TEMP:Fahrenheit'},
-                    'thresh': 60},
-                'label': 'NBM:TEMP:Fahrenheit:LT:60.000:35.000:75.000:true'},
-                {
-                'sourceType': 'condition',
-                'sourceObj': {
-                    'mapping': {
-                        'endWeight': [0, 1, 0],
-                        'startWeight': [0, 1, 0],
-                        'controlPoints': ['-Infinity', 0, 5, 'Infinity']},
-                    'relational': 'GREATERTHAN',
-                    'source': {
-                        'sourceType': 'units',
-                        'sourceObj': {
-                            'units': 'MPH',
-                            'source': {
-                                'sourceType': 'data',
-                                'sourceObj': {
-                                    'product': 'NBM',
-                                    'field': 'WINDSPEED',
-                                    'region': 'CONUS',
-                                    'valid': '2022-11-12T00:00:00.000Z',
-                                    'issue': '2022-11-11T14:00:00.000Z'}}},
-                        'label': 'NBM:WINDSPEED:MilesPerHour'},
-                    'thresh': 3},
-                'label': 'NBM:WINDSPEED:MilesPerHour:GT:3.000:0.000:5.000:true'}],
-            'join': 'AND'},
-        'label': ('AND(NBM:TEMP:Fahrenheit:LT:60.000:35.000:75.000:true, '
-                  'NBM:WINDSPEED:MilesPerHour:GT:3.000:0.000:5.000:true)')
-    }
+    return deepcopy(DAS_DATA_MESSAGE)
 
 
 # tests
-def test_validate_das_issue_request(info_request_validator: Validator):
-    message = {'sourceType': 'issue',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'region': 'PUERTO_RICO',
-                             'field': 'TEMP',
-                             }}
-    try:
-        info_request_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
-
-
-def test_validate_das_bad_issue_request(info_request_validator: Validator):
-    # message is missing 'region'
-    message = {'sourceType': 'field',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'field': 'TEMP',
-                             'valid': '2022-01-02T15:00:00.000Z'
-                             }}
-    with raises(ValidationError):
-        info_request_validator.validate(message)
-
-
-def test_validate_das_valid_request(info_request_validator: Validator):
-    message = {'sourceType': 'valid',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'region': 'PUERTO_RICO',
-                             'field': 'TEMP',
-                             'issue': '2022-01-02T12:00:00.000Z'
-                             }}
-    try:
-        info_request_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
-
-
-def test_validate_das_bad_valid_request(info_request_validator: Validator):
-    # message is missing 'field'
-    message = {'sourceType': 'valid',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'region': 'PUERTO_RICO',
-                             'issue': '2022-01-02T12:00:00.000Z'
-                             }}
-    with raises(ValidationError):
-        info_request_validator.validate(message)
-
-
-def test_validate_das_lead_request(info_request_validator: Validator):
-    message = {'sourceType': 'lead',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'region': 'PUERTO_RICO',
-                             'field': 'TEMP',
-                             'issue': '2022-01-02T12:00:00.000Z'
-                             }}
-    try:
-        info_request_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
-
-
-def test_validate_das_bad_lead_request(info_request_validator: Validator):
-    # message is missing 'product'
-    message = {'sourceType': 'valid',
-               'sourceObj': {'region': 'PUERTO_RICO',
-                             'field': 'TEMP',
-                             'issue': '2022-01-02T12:00:00.000Z'
-                             }}
-    with raises(ValidationError):
-        info_request_validator.validate(message)
-
-
-def test_validate_das_field_request(info_request_validator: Validator):
-    message = {'sourceType': 'field',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'region': 'PUERTO_RICO',
-                             'field': 'TEMP',
-                             'issue': '2022-01-02T12:00:00.000Z',
-                             'valid': '2022-01-02T15:00:00.000Z'
-                             }}
-    try:
-        info_request_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
-
-
-def test_validate_das_bad_field_request(info_request_validator: Validator):
-    # message is missing 'issue'
-    message = {'sourceType': 'field',
-               'sourceObj': {'product': 'NBM.AWS.GRIB',
-                             'region': 'PUERTO_RICO',
-                             'field': 'TEMP',
-                             'valid': '2022-01-02T15:00:00.000Z'
-                             }}
-    with raises(ValidationError):
+@mark.parametrize('source_type, source_obj, is_valid', [
+    ('issue', {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO', 'field': 'TEMP'}, True),
+    # missing 'region'
+    ('field', {'product': 'NBM.AWS.GRIB', 'field': 'TEMP', 'valid': '2022-01-02T15:00:00.000Z'},
+     False),
+    ('valid', {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO', 'field': 'TEMP',
+               'issue': '2022-01-02T12:00:00.000Z'}, True),
+    # missing 'field'
+    ('valid', {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO',
+               'issue': '2022-01-02T12:00:00.000Z'}, False),
+    ('lead', {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO', 'field': 'TEMP',
+              'issue': '2022-01-02T12:00:00.000Z'}, True),
+    # missing 'product'
+    ('valid', {'region': 'PUERTO_RICO', 'field': 'TEMP', 'issue': '2022-01-02T12:00:00.000Z'},
+     False),
+    ('field', {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO', 'field': 'TEMP',
+               'issue': '2022-01-02T12:00:00.000Z', 'valid': '2022-01-02T15:00:00.000Z'}, True),
+    # missing 'issue'
+    ('field', {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO', 'field': 'TEMP',
+               'valid': '2022-01-02T15:00:00.000Z'}, False),
+])
+def test_validate_das_info_request(info_request_validator: Validator,
+                                   source_type: str, source_obj: dict, is_valid: bool):
+    message = {'sourceType': source_type, 'sourceObj': source_obj}
+    if is_valid:
         info_request_validator.validate(message)
+    else:
+        assert not info_request_validator.is_valid(message)
 
 
 def test_validate_das_data_request(data_request_validator: Validator):
@@ -203,10 +146,7 @@ def test_validate_das_data_request(data_request_validator: Validator):
             'issue': '2022-11-11T14:00:00.000Z'
         }
     }
-    try:
-        data_request_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    data_request_validator.validate(message)
 
 
 def test_validate_das_bad_data_request(data_request_validator: Validator):
@@ -220,8 +160,23 @@ def test_validate_das_bad_data_request(data_request_validator: Validator):
             'issue': '2022-11-11T14:00:00.000Z'
         }
     }
-    with raises(ValidationError):
-        data_request_validator.validate(message)
+    assert not data_request_validator.is_valid(message)
+
+
+@mark.parametrize('message, is_valid', [
+    ({'sourceType': 'issue', 'sourceObj': {'product': 'NBM.AWS.GRIB', 'region': 'PUERTO_RICO',
+                                           'field': 'TEMP'}}, True),
+    ({'sourceType': 'data', 'sourceObj': {'product': 'NBM', 'region': 'CONUS', 'field': 'WINDSPEED',
+                                          'valid': '2022-11-12T00:00:00.000Z',
+                                          'issue': '2022-11-11T14:00:00.000Z'}}, True),
+    # missing 'product'
+    ({'sourceType': 'data', 'sourceObj': {'region': 'CONUS', 'field': 'WINDSPEED',
+                                          'valid': '2022-11-12T00:00:00.000Z',
+                                          'issue': '2022-11-11T14:00:00.000Z'}}, False),
+])
+def test_validate_das_request(request_validator: Validator, message: dict, is_valid: bool):
+    # das_request_schema accepts either an info request or a data request
+    assert request_validator.is_valid(message) == is_valid
 
 
 def test_validate_das_opr_with_single_source_request(data_request_validator: Validator):
@@ -242,10 +197,7 @@ def test_validate_das_opr_with_single_source_request(data_request_validator: Val
             }
         }
     }
-    try:
-        data_request_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    data_request_validator.validate(message)
 
 
 def test_validate_das_bad_opr_with_single_source_request(data_request_validator: Validator):
@@ -266,17 +218,12 @@ def test_validate_das_bad_opr_with_single_source_request(data_request_validator:
             }
         }
     }
-    with raises(ValidationError):
-        data_request_validator.validate(message)
+    assert not data_request_validator.is_valid(message)
 
 
-def test_validate_das_opr_with_multi_sources_request(data_request_validator: Validator,
-                                                     das_data_message: dict):
+def test_validate_das_opr_with_multi_sources_request(data_request_validator: Validator):
     # this is an example of a logical join operator, the operator itself is not validated
-    try:
-        data_request_validator.validate(das_data_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    data_request_validator.validate(DAS_DATA_MESSAGE)
 
 
 def test_validate_das_bad_opr_with_multi_sources_request(data_request_validator: Validator,
@@ -284,8 +231,7 @@ def test_validate_das_bad_opr_with_multi_sources_request(data_request_validator:
     # one of the operator object does not contains 'source', has 'not_source' instead
     mapping_opr = das_data_message['sourceObj']['sources'][1]['sourceObj']
     mapping_opr['not_source'] = mapping_opr.pop('source')
-    with raises(ValidationError):
-        data_request_validator.validate(das_data_message)
+    assert not data_request_validator.is_valid(das_data_message)
 
 
 def test_validate_das_data_response(data_response_validator: Validator):
@@ -325,7 +271,4 @@ def test_validate_das_data_response(data_response_validator: Validator):
         }
     }
 
-    try:
-        data_response_validator.validate(message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    data_response_validator.validate(message)
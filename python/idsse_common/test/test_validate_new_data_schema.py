@@ -12,88 +12,83 @@
 # pylint: disable=duplicate-code
 # cspell:ignore geodist
 
-import random
-from jsonschema.exceptions import ValidationError
+from copy import deepcopy
+
 from jsonschema.protocols import Validator
-from pytest import fixture, raises
+from pytest import fixture, mark
 
 from idsse.common.validate_schema import get_validator
 
 
-@fixture
+@fixture(scope="session")
 def new_data_validator() -> Validator:
     schema_name = 'new_data_schema'
     return get_validator(schema_name)
 
 
+NEW_FIELD_MESSAGE = {
+    "product": "NBM",
+    "region": "CONUS",
+    "issueDt": "2023-09-15T16:00:00.000Z",
+    "validDt": "2023-09-17T06:00:00.000Z",
+    "field": "TEMP"
+}
+
+
 @fixture
 def new_field_message() -> dict:
-    return {
-        "product": "NBM",
-        "region": "CONUS",
-        "issueDt": "2023-09-15T16:00:00.000Z",
-        "validDt": "2023-09-17T06:00:00.000Z",
-        "field": "TEMP"
-    }
+    return deepcopy(NEW_FIELD_MESSAGE)
+
+
+NEW_VALID_MESSAGE = {
+    "product": "NBM",
+    "region": "CONUS",
+    "issueDt": "2023-09-15T16:00:00.000Z",
+    "validDt": "2023-09-17T06:00:00.000Z",
+    "field": ["TEMP", "WINDSPEED"]
+}
 
 
 @fixture
 def new_valid_message() -> dict:
-    return {
-        "product": "NBM",
-        "region": "CONUS",
-        "issueDt": "2023-09-15T16:00:00.000Z",
-        "validDt": "2023-09-17T06:00:00.000Z",
-        "field": ["TEMP", "WINDSPEED"]
+    return deepcopy(NEW_VALID_MESSAGE)
+
+
+NEW_ISSUE_MESSAGE = {
+    "product": "NBM",
+    "region": "CONUS",
+    "issueDt": "2023-09-15T16:00:00.000Z",
+    "field": {
+        "2023-09-15T17:00:00.000Z": ["TEMP", "WINDSPEED"],
+        "2023-09-15T18:00:00.000Z": ["TEMP", "WINDSPEED"],
+        "2023-09-15T19:00:00.000Z": ["TEMP", "WINDSPEED"],
+        "2023-09-15T20:00:00.000Z": ["TEMP", "WINDSPEED"]
     }
+}
 
 
 @fixture
 def new_issue_message() -> dict:
-    return {
-        "product": "NBM",
-        "region": "CONUS",
-        "issueDt": "2023-09-15T16:00:00.000Z",
-        "field": {
-            "2023-09-15T17:00:00.000Z": ["TEMP", "WINDSPEED"],
-            "2023-09-15T18:00:00.000Z": ["TEMP", "WINDSPEED"],
-            "2023-09-15T19:00:00.000Z": ["TEMP", "WINDSPEED"],
-            "2023-09-15T20:00:00.000Z": ["TEMP", "WINDSPEED"]
-        }
-    }
+    return deepcopy(NEW_ISSUE_MESSAGE)
 
 
-def test_validate_new_field_data_message(new_data_validator: Validator,
-                                         new_field_message: dict):
-    try:
-        new_data_validator.validate(new_field_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+@mark.parametrize('message', [NEW_FIELD_MESSAGE, NEW_VALID_MESSAGE, NEW_ISSUE_MESSAGE],
+                  ids=['field', 'valid', 'issue'])
+def test_validate_new_data_message(new_data_validator: Validator, message: dict):
+    new_data_validator.validate(message)
 
 
 def test_validate_new_missing_field_data_message(new_data_validator: Validator,
                                                  new_field_message: dict):
     # convert a new field message to a missing field message by changing 'field' key to 'missing'
     new_field_message['missing'] = new_field_message.pop('field')
-    try:
-        new_data_validator.validate(new_field_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    new_data_validator.validate(new_field_message)
 
 
 def test_validate_new_field_data_message_missing_region(new_data_validator: Validator,
                                                         new_field_message: dict):
     new_field_message.pop('region')
-    with raises(ValidationError):
-        new_data_validator.validate(new_field_message)
-
-
-def test_validate_new_valid_data_message(new_data_validator: Validator,
-                                         new_valid_message: dict):
-    try:
-        new_data_validator.validate(new_valid_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    assert not new_data_validator.is_valid(new_field_message)
 
 
 def test_validate_new_missing_valid_data_message(new_data_validator: Validator,
@@ -102,25 +97,13 @@ def test_validate_new_missing_valid_data_message(new_data_validator: Validator,
     fields = new_valid_message['field']
     new_valid_message['field'] = fields[:-1]
     new_valid_message['missing'] = [fields[-1]]
-    try:
-        new_data_validator.validate(new_valid_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    new_data_validator.validate(new_valid_message)
 
 
 def test_validate_new_valid_data_message_bad_field(new_data_validator: Validator,
                                                    new_valid_message: dict):
     new_valid_message['field'].append('BAD_FIELD_NAME')
-    with raises(ValidationError):
-        new_data_validator.validate(new_valid_message)
-
-
-def test_validate_new_issue_data_message(new_data_validator: Validator,
-                                         new_issue_message: dict):
-    try:
-        new_data_validator.validate(new_issue_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    assert not new_data_validator.is_valid(new_valid_message)
 
 
 def test_validate_new_missing_issue_data_message(new_data_validator: Validator,
@@ -129,8 +112,9 @@ def test_validate_new_missing_issue_data_message(new_data_validator: Validator,
     fields = new_issue_message['field']
     found = {}
     missing = {}
-    for valid_key in fields:
-        if random.randint(0, 1):
+    # alternate between found and missing, so both parts of the message are always populated
+    for idx, valid_key in enumerate(fields):
+        if idx % 2:
             found[valid_key] = fields[valid_key]
             missing[valid_key] = []
         else:
@@ -139,10 +123,7 @@ def test_validate_new_missing_issue_data_message(new_data_validator: Validator,
 
     new_issue_message['field'] = found
     new_issue_message['missing'] = missing
-    try:
-        new_data_validator.validate(new_issue_message)
-    except ValidationError as exc:
-        assert False, f'Validate message raised an exception {exc}'
+    new_data_validator.validate(new_issue_message)
 
 
 def test_validate_new_issue_data_message_bad_valid_string(new_data_validator: Validator,
@@ -151,5 +132,4 @@ def test_validate_new_issue_data_message_bad_valid_string(new_data_validator: Va
     sample_fields = next(iter(new_issue_message['field'].values()))
     # use the good list but with a bad valid string
     new_issue_message['field']['Not a string rep of a valid date'] = sample_fields
-    with raises(ValidationError):
-        new_data_validator.validate(new_issue_message)
+    assert not new_data_validator.is_valid(new_issue_message)
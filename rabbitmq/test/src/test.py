@@ -9,8 +9,8 @@ import pika
 import sys
 import logging
 import json
-import time
 import argparse as ap
+from contextlib import closing
 
 # configure logging
 logging.basicConfig(
@@ -44,6 +44,20 @@ def main():
 
     return host, username, password
 
+def publish(channel, queue, body):
+    # with publisher confirms enabled on the channel, this returns once the broker has
+    # accepted the message (or raises UnroutableError/NackError if it did not)
+    channel.basic_publish(
+        exchange='',
+        routing_key=queue,
+        body=body,
+        properties=pika.BasicProperties(
+            delivery_mode=2,
+            headers={'originator': 'test.py'}
+        ),
+        mandatory=True
+    )
+
 if __name__ == '__main__':
     logging.info('Running python test to verify connection to RabbitMQ container')
     try:
@@ -57,30 +71,20 @@ if __name__ == '__main__':
 
         credentials = pika.PlainCredentials(username, password)
         connection = pika.BlockingConnection(pika.ConnectionParameters(host=host, credentials=credentials))
-        logging.info('Established connection to RabbitMQ %s', connection)
-        
-        channel = connection.channel()
-
-        logging.info('Connecting to queue: %s', queue)
-        channel.queue_declare(queue=queue, durable=True)
-
-        # send a test json to the queue to verify it works
-        message_body = json.dumps('{ "name":"John", "age":30, "car":null }')
-
-        channel.basic_publish(
-            exchange='',
-            routing_key=queue,
-            body=message_body,
-            properties=pika.BasicProperties(
-                delivery_mode=2,
-                headers={'originator': 'test.py'}
-            )
-        )
-
-        time.sleep(5) # give it a few seconds for the server to log the queue message
-
-        logging.info('Message sent')
-        connection.close()
+        with closing(connection):
+            logging.info('Established connection to RabbitMQ %s', connection)
+
+            channel = connection.channel()
+            channel.confirm_delivery()
+
+            logging.info('Connecting to queue: %s', queue)
+            channel.queue_declare(queue=queue, durable=True)
+
+            # send a test json to the queue to verify it works
+            message_body = json.dumps('{ "name":"John", "age":30, "car":null }')
+            publish(channel, queue, message_body)
+
+            logging.info('Message sent')
 
     except Exception as e:
         logging.error('Failed to test RabbitMQ driver due to exception: %s', str(e))
@@ -5,12 +5,13 @@
  *     Michael Rabellino
  *******************************************************************************/'''
 
-import os
+import base64
+import shlex
 import sys
 import logging
 import time
 import subprocess
-import urllib, urllib.request
+import urllib, urllib.parse, urllib.request
 
 # configure logging
 logging.basicConfig(
@@ -36,7 +37,7 @@ if '__main__' == __name__:
 
     # create a network for the RabbitMQ and event portfolio manager to run on
     try:
-        subprocess.check_output('docker network create ' + network, shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'network', 'create', network])
         logging.info('Created docker network: %s', network)
     except Exception as e:
         logging.warning('Container network already detected, continuing')
@@ -44,61 +45,72 @@ if '__main__' == __name__:
     # build the RabbitMQ server container
     try:
         logging.info('Building RabbitMQ server image')
-        subprocess.check_output('cd ..; docker build -t ' + server_image + ' .', shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'build', '-t', server_image, '.'], cwd='..')
     except Exception as e:
         logging.warning('Unable to build server container due to exception: %s', str(e))
 
     # build the test container
     try:
         logging.info('Building test image')
-        subprocess.check_output('docker build -t ' + test_image + ' .', shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'build', '-t', test_image, '.'])
     except Exception as e:
         logging.warning('Unable to build test container due to exception: %s', str(e))
     
     # run the RabbitMQ Server container
     try:
         logging.info('Running the RabbitMQ server container')
-        rabbit_mq_docker_server_cmd = (
-            'docker run --rm -d --name ' + host + ' ' +
-            '--network ' + network + ' ' +
-            '-e RABBITMQ_USER=' + username + ' ' +
-            '-e RABBITMQ_PASSWORD=' + password + ' ' +
-            '-p 15672:15672 ' +
+        rabbit_mq_docker_server_cmd = [
+            'docker', 'run', '--rm', '-d', '--name', host,
+            '--network', network,
+            '-e', f'RABBITMQ_USER={username}',
+            '-e', f'RABBITMQ_PASSWORD={password}',
+            '-p', '15672:15672',
             server_image
-        )
-        logging.info(rabbit_mq_docker_server_cmd)
-        subprocess.check_output(rabbit_mq_docker_server_cmd, shell=True).decode('utf-8')
+        ]
+        logging.info(shlex.join(rabbit_mq_docker_server_cmd))
+        subprocess.check_output(rabbit_mq_docker_server_cmd)
     except Exception as e:
         logging.warning('Unable to start the RabbitMQ server container due to exception: %s', str(e))
 
-    # allow for some time for the RabbitMQ server to start
+    # poll the RabbitMQ management API until the test user has permissions on vhost "/",
+    # backing off between attempts, rather than always waiting the worst case startup time.
+    # The WebUI, and even the user's login, come up before init.sh has set the permissions
+    # the test container needs, so the permissions endpoint (404 until then) is the check.
+    url = 'http://localhost:15672'
     logging.info('Waiting for RabbitMQ server to start...')
-    time.sleep(20)
-
-    # verify that RabbitMQ server is running
-    try:
-        url = 'http://localhost:15672'
-        logging.info('Checking that RabbitMQ WebUI is running at: %s', url)
-        response = urllib.request.urlopen(url)
-        response_obj = response.read().decode('utf-8')
-        if (response_obj.find('Click here to log in') > 0):
-            logging.info('  RabbitMQ server is running')
-        else:
+    credentials = base64.b64encode(f'{username}:{password}'.encode('utf-8')).decode('ascii')
+    permissions_request = urllib.request.Request(
+        f'{url}/api/permissions/%2F/{urllib.parse.quote(username, safe="")}',
+        headers={'Authorization': 'Basic ' + credentials}
+    )
+    deadline = time.monotonic() + 60
+    delay = 0.25
+    while True:
+        try:
+            with urllib.request.urlopen(permissions_request, timeout=1):
+                logging.info('  RabbitMQ server is running')
+                break
+        except Exception:
+            pass  # server not up, or user or its permissions not created yet
+
+        if time.monotonic() > deadline:
             logging.warning('  RabbitMQ server didnt start, test may fail...')
-    except Exception as e:
-        logging.warning('Problem connecting to RabbitMQ WebUI, verify it is running manually at: %s', url)
+            logging.warning('Verify it is running manually at: %s', url)
+            break
+        time.sleep(delay)
+        delay = min(delay * 1.5, 2.0)
 
     # run the test container
     try:
-        rabbit_mq_docker_test_cmd = (
-            'docker run --network ' + network + ' ' +
-            test_image + ' ' +
-            '--host=' + host + ' ' +
-            '--username=' + username + ' ' +
-            '--password=' + password + ' '
-        )
-        os.system(rabbit_mq_docker_test_cmd)
-        #subprocess.check_output(rabbit_mq_docker_test_cmd, shell=True).decode('utf-8')
+        rabbit_mq_docker_test_cmd = [
+            'docker', 'run', '--network', network,
+            test_image,
+            f'--host={host}',
+            f'--username={username}',
+            f'--password={password}'
+        ]
+        # output is not captured, so the test container's logs stream to this console
+        subprocess.run(rabbit_mq_docker_test_cmd, check=True)
     except Exception as e:
         logging.warning('Unable to run the test container due to exception: %s', str(e))
 
@@ -108,27 +120,27 @@ if '__main__' == __name__:
 
     # stop test server container
     try:
-        subprocess.check_output('docker stop ' + host, shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'stop', host])
         logging.info('Removed test RabbitMQ container: %s', host)
     except Exception as e:
         logging.warning('Unable to stop server container, please stop manually: $ docker stop %s', host)
     # remove test server image
     try:
-        subprocess.check_output('docker image rm -f ' + server_image, shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'image', 'rm', '-f', server_image])
         logging.info('Removed docker image: %s', server_image)
     except Exception as e:
         logging.warning('Unable to remove server image, please delete manually: $ docker image rm %s', server_image)
 
     # remove test container
     try:
-        subprocess.check_output('docker image rm -f ' + test_image, shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'image', 'rm', '-f', test_image])
         logging.info('Removed docker image: %s', test_image)
     except Exception as e:
         logging.warning('Unable to remove test image, please delete manually: $ docker image rm %s', test_image)
 
     # remove docker network
     try:
-        subprocess.check_output('docker network rm ' + network, shell=True).decode('utf-8')
+        subprocess.check_output(['docker', 'network', 'rm', network])
         logging.info('Removed docker network: %s', network)
     except Exception as e:
         logging.warning('Unable to remove container network, please delete manually: $ docker network rm %s', network)